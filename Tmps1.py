@@ -1,465 +1,974 @@
-import tkinter as tk
-from tkinter import scrolledtext
-import copy
-from abc import ABC, abstractmethod
-
-
-# ---------------- Singleton Pattern: Логгер ----------------
-class SingletonLogger:
-    _instance = None
-
-    def __new__(cls, gui_callback=None):
-        if cls._instance is None:
-            cls._instance = super(SingletonLogger, cls).__new__(cls)
-            cls._instance.gui_callback = gui_callback
-        return cls._instance
-
-    def log(self, message):
-        log_message = f"[LOG]: {message}"
-        print(log_message)
-        if self.gui_callback:
-            self.gui_callback(log_message + "\n")
-
-
-# ---------------- Prototype Pattern: Базовый класс робота ----------------
-class Robot(ABC):
-    def __init__(self, name):
-        self.name = name
-        self.components = {}  # Словарь для хранения деталей робота
-
-    @abstractmethod
-    def perform(self):
-        pass
-
-    def clone(self):
-        return copy.deepcopy(self)
-
-    def __str__(self):
-        return f"{self.name}: {self.components}"
-
-
-# Конкретные реализации роботов
-class HumanoidRobot(Robot):
-    def perform(self):
-        return f"{self.name} is performing human-like actions."
-
-
-class HeavyRobot(Robot):
-    def perform(self):
-        return f"{self.name} is performing heavy-duty tasks."
-
-
-# ---------------- Abstract Factory Pattern: Фабрика деталей робота ----------------
-class RobotPartFactory(ABC):
-    @abstractmethod
-    def create_head(self):
-        pass
-
-    @abstractmethod
-    def create_torso(self):
-        pass
-
-    @abstractmethod
-    def create_limbs(self):
-        pass
-
-
-class HumanoidPartFactory(RobotPartFactory):
-    def create_head(self):
-        return "Smart Face"
-
-    def create_torso(self):
-        return "Sleek Body"
-
-    def create_limbs(self):
-        return "Agile Limbs"
-
-
-class HeavyPartFactory(RobotPartFactory):
-    def create_head(self):
-        return "Armored Head"
-
-    def create_torso(self):
-        return "Reinforced Frame"
-
-    def create_limbs(self):
-        return "Robust Limbs"
-
-
-# ---------------- Builder Pattern: Построение робота ----------------
-class RobotBuilder(ABC):
-    @abstractmethod
-    def build_head(self):
-        pass
-
-    @abstractmethod
-    def build_torso(self):
-        pass
-
-    @abstractmethod
-    def build_limbs(self):
-        pass
-
-    @abstractmethod
-    def get_robot(self):
-        pass
-
-
-class HumanoidRobotBuilder(RobotBuilder):
-    def __init__(self, name):
-        self.robot = HumanoidRobot(name)
-        self.part_factory = HumanoidPartFactory()
-        SingletonLogger().log("HumanoidRobotBuilder initialized")
-
-    def build_head(self):
-        self.robot.components['head'] = self.part_factory.create_head()
-        SingletonLogger().log("Built humanoid head")
-
-    def build_torso(self):
-        self.robot.components['torso'] = self.part_factory.create_torso()
-        SingletonLogger().log("Built humanoid torso")
-
-    def build_limbs(self):
-        self.robot.components['limbs'] = self.part_factory.create_limbs()
-        SingletonLogger().log("Built humanoid limbs")
-
-    def get_robot(self):
-        return self.robot
-
-
-class HeavyRobotBuilder(RobotBuilder):
-    def __init__(self, name):
-        self.robot = HeavyRobot(name)
-        self.part_factory = HeavyPartFactory()
-        SingletonLogger().log("HeavyRobotBuilder initialized")
-
-    def build_head(self):
-        self.robot.components['head'] = self.part_factory.create_head()
-        SingletonLogger().log("Built heavy robot head")
-
-    def build_torso(self):
-        self.robot.components['torso'] = self.part_factory.create_torso()
-        SingletonLogger().log("Built heavy robot torso")
-
-    def build_limbs(self):
-        self.robot.components['limbs'] = self.part_factory.create_limbs()
-        SingletonLogger().log("Built heavy robot limbs")
-
-    def get_robot(self):
-        return self.robot
-
-
-class RobotDirector:
-    def __init__(self, builder: RobotBuilder):
-        self.builder = builder
-        SingletonLogger().log("RobotDirector initialized")
-
-    def construct_robot(self):
-        self.builder.build_head()
-        self.builder.build_torso()
-        self.builder.build_limbs()
-        return self.builder.get_robot()
-
-
-# ---------------- Factory Method Pattern: Фабрики роботов ----------------
-class RobotFactory(ABC):
-    @abstractmethod
-    def create_robot(self, name):
-        pass
-
-
-class HumanoidRobotFactory(RobotFactory):
-    def create_robot(self, name):
-        SingletonLogger().log(f"Creating Humanoid Robot: {name}")
-        builder = HumanoidRobotBuilder(name)
-        director = RobotDirector(builder)
-        return director.construct_robot()
-
-
-class HeavyRobotFactory(RobotFactory):
-    def create_robot(self, name):
-        SingletonLogger().log(f"Creating Heavy Robot: {name}")
-        builder = HeavyRobotBuilder(name)
-        director = RobotDirector(builder)
-        return director.construct_robot()
-
-
-# ---------------- GUI: Приложение для создания и визуализации роботов ----------------
-class RobotFactoryApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Robot Factory Application")
-
-        # Левая панель: управление и лог
-        self.left_panel = tk.Frame(root)
-        self.left_panel.grid(row=0, column=0, padx=10, pady=10, sticky="ns")
-        # Правая панель: визуализация роботов
-        self.right_panel = tk.Frame(root)
-        self.right_panel.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
-        root.grid_columnconfigure(1, weight=1)
-        root.grid_rowconfigure(0, weight=1)
-
-        # Элементы управления на левой панели
-        self.name_label = tk.Label(self.left_panel, text="Enter Robot Name:")
-        self.name_label.pack(pady=5)
-        self.name_entry = tk.Entry(self.left_panel, width=25)
-        self.name_entry.pack(pady=5)
-        self.btn_humanoid = tk.Button(self.left_panel, text="Create Humanoid Robot", command=self.create_humanoid_robot)
-        self.btn_humanoid.pack(pady=5)
-        self.btn_heavy = tk.Button(self.left_panel, text="Create Heavy Robot", command=self.create_heavy_robot)
-        self.btn_heavy.pack(pady=5)
-        self.btn_clone = tk.Button(self.left_panel, text="Clone Last Robot", command=self.clone_robot)
-        self.btn_clone.pack(pady=5)
-        self.robot_list_label = tk.Label(self.left_panel, text="Robots:")
-        self.robot_list_label.pack(pady=5)
-        self.robot_listbox = tk.Listbox(self.left_panel, width=40, height=8)
-        self.robot_listbox.pack(pady=5)
-        self.log_label = tk.Label(self.left_panel, text="Log:")
-        self.log_label.pack(pady=5)
-        self.log_text = scrolledtext.ScrolledText(self.left_panel, width=40, height=10, state=tk.DISABLED)
-        self.log_text.pack(pady=5)
-
-        # Область визуализации робота на правой панели
-        self.canvas = tk.Canvas(self.right_panel, width=400, height=400, bg="lightgray")
-        self.canvas.pack(fill="both", expand=True)
-
-        # Инициализация логгера с передачей функции обновления лога
-        self.logger = SingletonLogger(self.update_log)
-        self.logger.log("Application started")
-
-        # Фабрики роботов
-        self.humanoid_factory = HumanoidRobotFactory()
-        self.heavy_factory = HeavyRobotFactory()
-
-        self.robots = []
-        self.last_robot = None
-
-    def update_log(self, message):
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message)
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
-
-    def update_robot_list(self):
-        self.robot_listbox.delete(0, tk.END)
-        for robot in self.robots:
-            self.robot_listbox.insert(tk.END, str(robot))
-
-    def draw_robot(self, robot):
-        self.canvas.delete("all")
-        if isinstance(robot, HumanoidRobot):
-            # Голова: вариант "Oval" (по умолчанию) или "Square"
-            head_style = robot.components.get("head_style", "Oval").lower()
-            if head_style == "square":
-                self.canvas.create_rectangle(170, 40, 230, 100, fill="peachpuff", outline="black", width=2)
-                self.canvas.create_line(230, 40, 230, 100, fill="gray", width=2, dash=(2, 2))
-            else:
-                self.canvas.create_oval(170, 40, 230, 100, fill="peachpuff", outline="black", width=2)
-                self.canvas.create_arc(175, 45, 225, 95, start=30, extent=120, style=tk.ARC, outline="white", width=1)
-            # Глаза – прорисовка белков и радужки
-            eye_color = robot.components.get("eye_color", "black")
-            self.canvas.create_oval(185, 60, 195, 70, fill="white", outline="black")
-            self.canvas.create_oval(188, 63, 192, 67, fill=eye_color, outline=eye_color)
-            self.canvas.create_oval(205, 60, 215, 70, fill="white", outline="black")
-            self.canvas.create_oval(208, 63, 212, 67, fill=eye_color, outline=eye_color)
-            # Рот – легкая улыбка
-            self.canvas.create_arc(180, 70, 220, 90, start=200, extent=140, style=tk.CHORD, fill="red")
-            # Торс: если "Muscular" – более массивный с "мышцами"
-            torso_style = robot.components.get("torso_style", "Standard").lower()
-            if torso_style == "muscular":
-                self.canvas.create_rectangle(175, 100, 215, 170, fill="lightblue", outline="black", width=4)
-                self.canvas.create_line(175, 135, 215, 135, fill="blue", width=2)
-                self.canvas.create_line(195, 100, 195, 170, fill="blue", width=2)
-            else:
-                self.canvas.create_rectangle(185, 100, 215, 170, fill="skyblue", outline="black", width=2)
-            # Руки: если "Hydraulic" – более массивные с суставами
-            arm_style = robot.components.get("arm_style", "Standard").lower()
-            if arm_style == "hydraulic":
-                self.canvas.create_line(185, 110, 150, 140, fill="black", width=5)
-                self.canvas.create_oval(145, 135, 155, 145, fill="gray", outline="black")
-                self.canvas.create_line(215, 110, 250, 140, fill="black", width=5)
-                self.canvas.create_oval(245, 135, 255, 145, fill="gray", outline="black")
-            else:
-                self.canvas.create_line(185, 110, 150, 140, fill="black", width=3)
-                self.canvas.create_line(215, 110, 250, 140, fill="black", width=3)
-                self.canvas.create_oval(145, 135, 155, 145, fill="black")
-                self.canvas.create_oval(245, 135, 255, 145, fill="black")
-            # Ноги: если "Wide" – рисуем широкие ноги с суставами
-            if robot.components.get("legs", "Standard").lower() == "wide":
-                self.canvas.create_rectangle(180, 170, 200, 220, fill="black")
-                self.canvas.create_rectangle(200, 170, 220, 220, fill="black")
-                self.canvas.create_oval(190, 215, 200, 225, fill="gray", outline="black")
-                self.canvas.create_oval(210, 215, 220, 225, fill="gray", outline="black")
-            else:
-                self.canvas.create_line(190, 170, 190, 220, fill="black", width=3)
-                self.canvas.create_line(210, 170, 210, 220, fill="black", width=3)
-                self.canvas.create_oval(185, 215, 195, 225, fill="black")
-                self.canvas.create_oval(205, 215, 215, 225, fill="black")
-            # Антенна: прорисовка, если выбрана
-            if robot.components.get("antenna", "None").lower() != "none":
-                self.canvas.create_line(200, 40, 200, 15, fill="green", width=2)
-                self.canvas.create_oval(195, 10, 205, 20, fill="green", outline="black")
-                self.canvas.create_oval(197, 12, 203, 18, fill="lightgreen", outline="green")
-            self.canvas.create_text(200, 20, text=robot.name, font=("Helvetica", 16, "bold"), fill="darkblue")
-
-        elif isinstance(robot, HeavyRobot):
-            # Голова: вариант "Dome" или "Rectangle"
-            head_style = robot.components.get("head_style", "Rectangle").lower()
-            if head_style == "dome":
-                self.canvas.create_arc(150, 40, 250, 90, start=0, extent=180, fill="dimgray", outline="black", width=3)
-                self.canvas.create_line(150, 65, 250, 65, fill="black", width=2)
-            else:
-                self.canvas.create_rectangle(150, 40, 250, 90, fill="dimgray", outline="black", width=3)
-            for x in range(160, 240, 20):
-                self.canvas.create_oval(x, 45, x + 10, 55, fill="black")
-            # Торс: если "Armored", прорисовка с панелями
-            torso_style = robot.components.get("torso_style", "Standard").lower()
-            if torso_style == "armored":
-                self.canvas.create_rectangle(140, 90, 260, 180, fill="gray", outline="black", width=4)
-                self.canvas.create_line(140, 130, 260, 130, fill="black", width=2)
-                self.canvas.create_line(200, 90, 200, 180, fill="black", width=2)
-            else:
-                self.canvas.create_rectangle(140, 90, 260, 180, fill="gray", outline="black", width=3)
-            # Руки: если "Robotic", прорисовка механических деталей
-            arm_style = robot.components.get("arm_style", "Standard").lower()
-            if arm_style == "robotic":
-                self.canvas.create_rectangle(110, 90, 140, 150, fill="dimgray", outline="black", width=3)
-                self.canvas.create_rectangle(260, 90, 290, 150, fill="dimgray", outline="black", width=3)
-                self.canvas.create_line(125, 90, 125, 70, fill="black", width=2)
-                self.canvas.create_line(275, 90, 275, 70, fill="black", width=2)
-                self.canvas.create_oval(120, 70, 130, 80, fill="black", outline="gray")
-                self.canvas.create_oval(270, 70, 280, 80, fill="black", outline="gray")
-            else:
-                self.canvas.create_rectangle(110, 90, 140, 150, fill="dimgray", outline="black", width=3)
-                self.canvas.create_rectangle(260, 90, 290, 150, fill="dimgray", outline="black", width=3)
-            # Ноги: если "Wide" – прорисовка широких ног с суставами
-            if robot.components.get("legs", "Standard").lower() == "wide":
-                self.canvas.create_rectangle(160, 180, 190, 260, fill="black", outline="black")
-                self.canvas.create_rectangle(210, 180, 240, 260, fill="black", outline="black")
-                self.canvas.create_oval(170, 255, 180, 265, fill="gray", outline="black")
-                self.canvas.create_oval(220, 255, 230, 265, fill="gray", outline="black")
-            else:
-                self.canvas.create_rectangle(170, 180, 190, 260, fill="black", outline="black")
-                self.canvas.create_rectangle(210, 180, 230, 260, fill="black", outline="black")
-            # Антенна
-            if robot.components.get("antenna", "None").lower() != "none":
-                self.canvas.create_line(200, 40, 200, 15, fill="green", width=2)
-                self.canvas.create_oval(195, 10, 205, 20, fill="green", outline="black")
-                self.canvas.create_oval(197, 12, 203, 18, fill="lightgreen", outline="green")
-            self.canvas.create_text(200, 20, text=robot.name, font=("Helvetica", 16, "bold"), fill="darkred")
-        else:
-            self.canvas.create_text(200, 200, text="Unknown Robot Type", font=("Helvetica", 16))
-
-    def create_humanoid_robot(self):
-        name = self.name_entry.get().strip() or f"Humanoid-{len(self.robots) + 1}"
-        robot = self.humanoid_factory.create_robot(name)
-        self.last_robot = robot
-        self.robots.append(robot)
-        self.logger.log(f"Created humanoid robot: {robot}")
-        self.update_robot_list()
-        self.draw_robot(robot)
-
-    def create_heavy_robot(self):
-        name = self.name_entry.get().strip() or f"Heavy-{len(self.robots) + 1}"
-        robot = self.heavy_factory.create_robot(name)
-        self.last_robot = robot
-        self.robots.append(robot)
-        self.logger.log(f"Created heavy robot: {robot}")
-        self.update_robot_list()
-        self.draw_robot(robot)
-
-    def clone_robot(self):
-        if self.last_robot:
-            new_robot = self.last_robot.clone()
-            new_robot.name = f"{new_robot.name}_clone"
-            self.robots.append(new_robot)
-            self.last_robot = new_robot
-            self.logger.log(f"Cloned robot: {new_robot}")
-            self.update_robot_list()
-            self.draw_robot(new_robot)
-            self.open_edit_dialog(new_robot)
-        else:
-            self.logger.log("No robot to clone.")
-
-    def open_edit_dialog(self, robot):
-        edit_window = tk.Toplevel(self.root)
-        edit_window.title("Edit Cloned Robot")
-
-        # Имя робота
-        tk.Label(edit_window, text="New Robot Name:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-        name_var = tk.StringVar(value=robot.name)
-        tk.Entry(edit_window, textvariable=name_var).grid(row=0, column=1, padx=5, pady=5)
-
-        # Антенна
-        tk.Label(edit_window, text="Antenna:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
-        antenna_options = ["None", "Small", "Large"]
-        antenna_var = tk.StringVar(value=robot.components.get("antenna", "None"))
-        tk.OptionMenu(edit_window, antenna_var, *antenna_options).grid(row=1, column=1, padx=5, pady=5, sticky="ew")
-
-        # Legs style
-        tk.Label(edit_window, text="Legs style:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
-        legs_options = ["Standard", "Wide"]
-        legs_var = tk.StringVar(value=robot.components.get("legs", "Standard"))
-        tk.OptionMenu(edit_window, legs_var, *legs_options).grid(row=2, column=1, padx=5, pady=5, sticky="ew")
-
-        # Head style
-        tk.Label(edit_window, text="Head Style:").grid(row=3, column=0, padx=5, pady=5, sticky="w")
-        if isinstance(robot, HumanoidRobot):
-            head_options = ["Oval", "Square"]
-        else:
-            head_options = ["Rectangle", "Dome"]
-        head_var = tk.StringVar(value=robot.components.get("head_style", head_options[0]))
-        tk.OptionMenu(edit_window, head_var, *head_options).grid(row=3, column=1, padx=5, pady=5, sticky="ew")
-
-        # Torso style
-        tk.Label(edit_window, text="Torso Style:").grid(row=4, column=0, padx=5, pady=5, sticky="w")
-        if isinstance(robot, HumanoidRobot):
-            torso_options = ["Standard", "Muscular"]
-        else:
-            torso_options = ["Standard", "Armored"]
-        torso_var = tk.StringVar(value=robot.components.get("torso_style", "Standard"))
-        tk.OptionMenu(edit_window, torso_var, *torso_options).grid(row=4, column=1, padx=5, pady=5, sticky="ew")
-
-        # Arm style
-        tk.Label(edit_window, text="Arm Style:").grid(row=5, column=0, padx=5, pady=5, sticky="w")
-        if isinstance(robot, HumanoidRobot):
-            arm_options = ["Standard", "Hydraulic"]
-        else:
-            arm_options = ["Standard", "Robotic"]
-        arm_var = tk.StringVar(value=robot.components.get("arm_style", "Standard"))
-        tk.OptionMenu(edit_window, arm_var, *arm_options).grid(row=5, column=1, padx=5, pady=5, sticky="ew")
-
-        # Eye color (только для Humanoid)
-        if isinstance(robot, HumanoidRobot):
-            tk.Label(edit_window, text="Eye Color:").grid(row=6, column=0, padx=5, pady=5, sticky="w")
-            eye_options = ["Black", "Blue", "Green", "Brown", "Hazel"]
-            eye_var = tk.StringVar(value=robot.components.get("eye_color", "Black"))
-            tk.OptionMenu(edit_window, eye_var, *eye_options).grid(row=6, column=1, padx=5, pady=5, sticky="ew")
-            row_offset = 1
-        else:
-            row_offset = 0
-
-        def apply_changes():
-            new_name = name_var.get().strip()
-            if new_name:
-                robot.name = new_name
-            robot.components["antenna"] = antenna_var.get()
-            robot.components["legs"] = legs_var.get()
-            robot.components["head_style"] = head_var.get()
-            robot.components["torso_style"] = torso_var.get()
-            robot.components["arm_style"] = arm_var.get()
-            if isinstance(robot, HumanoidRobot):
-                robot.components["eye_color"] = eye_var.get()
-            self.logger.log(f"Modified cloned robot: {robot}")
-            self.update_robot_list()
-            self.draw_robot(robot)
-            edit_window.destroy()
-
-        tk.Button(edit_window, text="Apply Changes", command=apply_changes).grid(row=7 + row_offset, column=0,
-                                                                                 columnspan=2, pady=10)
-
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = RobotFactoryApp(root)
-    root.mainloop()
+import tkinter as tk
+from tkinter import scrolledtext
+from abc import ABC, abstractmethod
+from enum import IntEnum
+
+
+# ---------------- Коды стилей: int-сравнение и хеш вместо строк ----------------
+class HeadStyle(IntEnum):
+    OVAL = 0
+    SQUARE = 1
+    RECTANGLE = 2
+    DOME = 3
+
+
+class TorsoStyle(IntEnum):
+    STANDARD = 0
+    MUSCULAR = 1
+    ARMORED = 2
+
+
+class ArmStyle(IntEnum):
+    STANDARD = 0
+    HYDRAULIC = 1
+    ROBOTIC = 2
+
+
+class LegStyle(IntEnum):
+    STANDARD = 0
+    WIDE = 1
+
+
+class AntennaStyle(IntEnum):
+    NONE = 0
+    SMALL = 1
+    LARGE = 2
+
+
+# ---------------- Singleton Pattern: Логгер ----------------
+# Уровни логирования: пошаговые сообщения построения идут как DEBUG и по
+# умолчанию отбрасываются до print и вставки в GUI
+LOG_DEBUG = 10
+LOG_INFO = 20
+
+
+class SingletonLogger:
+    _instance = None
+
+    def __new__(cls, gui_callback=None):
+        if cls._instance is None:
+            cls._instance = super(SingletonLogger, cls).__new__(cls)
+            cls._instance.gui_callback = gui_callback
+            cls._instance.level = LOG_INFO
+        return cls._instance
+
+    def log(self, message, level=LOG_INFO):
+        if level < self.level:
+            return
+        log_message = f"[LOG]: {message}"
+        print(log_message)
+        if self.gui_callback:
+            self.gui_callback(log_message + "\n")
+
+
+_LOG = None
+
+
+def log(message, level=LOG_INFO):
+    # Модульная точка логирования: кэшируем связанный метод один раз,
+    # чтобы не проходить через SingletonLogger.__new__ на каждый вызов
+    global _LOG
+    if _LOG is None:
+        _LOG = SingletonLogger().log
+    _LOG(message, level)
+
+
+# ---------------- Prototype Pattern: Базовый класс робота ----------------
+class Robot(ABC):
+    def __init__(self, name):
+        self.name = name
+        self.components = {}  # Словарь для хранения деталей робота
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        # Переименование (например, клона) сбрасывает кэшированные строки
+        self._name = value
+        self._str_cache = None  # Готовая строка для списка роботов
+        self._perform_msg = None  # Готовое сообщение perform()
+
+    @abstractmethod
+    def perform(self):
+        pass
+
+    def clone(self):
+        # Специализированная копия вместо copy.deepcopy: состояние робота -
+        # это строка name и плоский словарь components, поэтому достаточно
+        # нового экземпляра того же типа и копии словаря
+        new = object.__new__(type(self))
+        new.name = self.name
+        new.components = dict(self.components)
+        return new
+
+    def __str__(self):
+        # Кэшируем готовую строку: список роботов перечитывает ее при
+        # каждом обновлении, а name/components меняются редко
+        cached = self._str_cache
+        if cached is None:
+            parts = "; ".join(
+                f"{key}={value.name.title() if isinstance(value, IntEnum) else value}"
+                for key, value in self.components.items()
+            )
+            cached = self._str_cache = f"{self.name}: {parts}"
+        return cached
+
+
+# Конкретные реализации роботов
+class HumanoidRobot(Robot):
+    def perform(self):
+        # Сообщение собирается один раз и заново только после переименования
+        msg = self._perform_msg
+        if msg is None:
+            msg = self._perform_msg = f"{self.name} is performing human-like actions."
+        return msg
+
+
+class HeavyRobot(Robot):
+    def perform(self):
+        msg = self._perform_msg
+        if msg is None:
+            msg = self._perform_msg = f"{self.name} is performing heavy-duty tasks."
+        return msg
+
+
+# ---------------- Abstract Factory Pattern: Фабрика деталей робота ----------------
+class RobotPartFactory(ABC):
+    @abstractmethod
+    def create_head(self):
+        pass
+
+    @abstractmethod
+    def create_torso(self):
+        pass
+
+    @abstractmethod
+    def create_limbs(self):
+        pass
+
+
+class HumanoidPartFactory(RobotPartFactory):
+    # Детали – чистые константы класса, методы лишь возвращают их
+    HEAD = "Smart Face"
+    TORSO = "Sleek Body"
+    LIMBS = "Agile Limbs"
+
+    def create_head(self):
+        return self.HEAD
+
+    def create_torso(self):
+        return self.TORSO
+
+    def create_limbs(self):
+        return self.LIMBS
+
+
+class HeavyPartFactory(RobotPartFactory):
+    HEAD = "Armored Head"
+    TORSO = "Reinforced Frame"
+    LIMBS = "Robust Limbs"
+
+    def create_head(self):
+        return self.HEAD
+
+    def create_torso(self):
+        return self.TORSO
+
+    def create_limbs(self):
+        return self.LIMBS
+
+
+# Фабрики деталей не хранят состояния – достаточно по одному экземпляру на модуль
+_HUMANOID_PART_FACTORY = HumanoidPartFactory()
+_HEAVY_PART_FACTORY = HeavyPartFactory()
+
+
+# ---------------- Builder Pattern: Построение робота ----------------
+class RobotBuilder(ABC):
+    @abstractmethod
+    def build_head(self):
+        pass
+
+    @abstractmethod
+    def build_torso(self):
+        pass
+
+    @abstractmethod
+    def build_limbs(self):
+        pass
+
+    @abstractmethod
+    def get_robot(self):
+        pass
+
+
+class HumanoidRobotBuilder(RobotBuilder):
+    def __init__(self, name):
+        self.robot = HumanoidRobot(name)
+        self.part_factory = _HUMANOID_PART_FACTORY
+        log("HumanoidRobotBuilder initialized", LOG_DEBUG)
+
+    def build_head(self):
+        self.robot.components['head'] = self.part_factory.create_head()
+        self.robot._str_cache = None
+        log("Built humanoid head", LOG_DEBUG)
+
+    def build_torso(self):
+        self.robot.components['torso'] = self.part_factory.create_torso()
+        self.robot._str_cache = None
+        log("Built humanoid torso", LOG_DEBUG)
+
+    def build_limbs(self):
+        self.robot.components['limbs'] = self.part_factory.create_limbs()
+        self.robot._str_cache = None
+        log("Built humanoid limbs", LOG_DEBUG)
+
+    def get_robot(self):
+        return self.robot
+
+
+class HeavyRobotBuilder(RobotBuilder):
+    def __init__(self, name):
+        self.robot = HeavyRobot(name)
+        self.part_factory = _HEAVY_PART_FACTORY
+        log("HeavyRobotBuilder initialized", LOG_DEBUG)
+
+    def build_head(self):
+        self.robot.components['head'] = self.part_factory.create_head()
+        self.robot._str_cache = None
+        log("Built heavy robot head", LOG_DEBUG)
+
+    def build_torso(self):
+        self.robot.components['torso'] = self.part_factory.create_torso()
+        self.robot._str_cache = None
+        log("Built heavy robot torso", LOG_DEBUG)
+
+    def build_limbs(self):
+        self.robot.components['limbs'] = self.part_factory.create_limbs()
+        self.robot._str_cache = None
+        log("Built heavy robot limbs", LOG_DEBUG)
+
+    def get_robot(self):
+        return self.robot
+
+
+# Готовые наборы деталей для "горячего" пути фабрик: один dict.update
+# вместо цепочки Builder/Director (классы выше оставлены как демонстрация
+# паттерна и для пошагового построения)
+HUMANOID_PARTS = {
+    "head": HumanoidPartFactory.HEAD,
+    "torso": HumanoidPartFactory.TORSO,
+    "limbs": HumanoidPartFactory.LIMBS,
+}
+
+HEAVY_PARTS = {
+    "head": HeavyPartFactory.HEAD,
+    "torso": HeavyPartFactory.TORSO,
+    "limbs": HeavyPartFactory.LIMBS,
+}
+
+
+class RobotDirector:
+    def __init__(self, builder: RobotBuilder):
+        self.builder = builder
+        log("RobotDirector initialized", LOG_DEBUG)
+
+    def construct_robot(self):
+        self.builder.build_head()
+        self.builder.build_torso()
+        self.builder.build_limbs()
+        return self.builder.get_robot()
+
+
+# ---------------- Factory Method Pattern: Фабрики роботов ----------------
+class RobotFactory(ABC):
+    @abstractmethod
+    def create_robot(self, name):
+        pass
+
+
+class HumanoidRobotFactory(RobotFactory):
+    def create_robot(self, name):
+        robot = HumanoidRobot(name)
+        robot.components.update(HUMANOID_PARTS)
+        log(f"Creating Humanoid Robot: {name} (head, torso, limbs)")
+        return robot
+
+
+class HeavyRobotFactory(RobotFactory):
+    def create_robot(self, name):
+        robot = HeavyRobot(name)
+        robot.components.update(HEAVY_PARTS)
+        log(f"Creating Heavy Robot: {name} (head, torso, limbs)")
+        return robot
+
+
+# ---------------- Таблицы отрисовки: примитивы и отрисовщики стилей ----------------
+# Координаты примитивов: константные кортежи собираются один раз при
+# импорте и передаются в create_*/coords через распаковку. Вся числовая
+# часть отрисовки сводится к этим готовым значениям; если появится
+# параметрическое масштабирование/поворот, пересчитывать стоит здесь
+# одним проходом, а не поэлементно в пути отрисовки
+HUM_HEAD = (170, 40, 230, 100)
+HUM_HEAD_SHADE = (230, 40, 230, 100)
+HUM_HEAD_SHINE = (175, 45, 225, 95)
+HUM_LEFT_EYE = (185, 60, 195, 70)
+HUM_LEFT_IRIS = (188, 63, 192, 67)
+HUM_RIGHT_EYE = (205, 60, 215, 70)
+HUM_RIGHT_IRIS = (208, 63, 212, 67)
+HUM_MOUTH = (180, 70, 220, 90)
+HUM_TORSO_STANDARD = (185, 100, 215, 170)
+HUM_TORSO_MUSCULAR = (175, 100, 215, 170)
+HUM_TORSO_MUSCLE_H = (175, 135, 215, 135)
+HUM_TORSO_MUSCLE_V = (195, 100, 195, 170)
+HUM_LEFT_ARM = (185, 110, 150, 140)
+HUM_RIGHT_ARM = (215, 110, 250, 140)
+HUM_LEFT_ARM_JOINT = (145, 135, 155, 145)
+HUM_RIGHT_ARM_JOINT = (245, 135, 255, 145)
+HUM_LEFT_LEG_LINE = (190, 170, 190, 220)
+HUM_RIGHT_LEG_LINE = (210, 170, 210, 220)
+HUM_LEFT_LEG_WIDE = (180, 170, 200, 220)
+HUM_RIGHT_LEG_WIDE = (200, 170, 220, 220)
+HUM_LEFT_FOOT_STANDARD = (185, 215, 195, 225)
+HUM_RIGHT_FOOT_STANDARD = (205, 215, 215, 225)
+HUM_LEFT_FOOT_WIDE = (190, 215, 200, 225)
+HUM_RIGHT_FOOT_WIDE = (210, 215, 220, 225)
+
+HEAVY_HEAD = (150, 40, 250, 90)
+HEAVY_HEAD_DOME_LINE = (150, 65, 250, 65)
+HEAVY_TORSO = (140, 90, 260, 180)
+HEAVY_TORSO_PANEL_H = (140, 130, 260, 130)
+HEAVY_TORSO_PANEL_V = (200, 90, 200, 180)
+HEAVY_LEFT_ARM_BOX = (110, 90, 140, 150)
+HEAVY_RIGHT_ARM_BOX = (260, 90, 290, 150)
+HEAVY_LEFT_ARM_ROD = (125, 90, 125, 70)
+HEAVY_RIGHT_ARM_ROD = (275, 90, 275, 70)
+HEAVY_LEFT_ARM_JOINT = (120, 70, 130, 80)
+HEAVY_RIGHT_ARM_JOINT = (270, 70, 280, 80)
+HEAVY_LEFT_LEG_STANDARD = (170, 180, 190, 260)
+HEAVY_RIGHT_LEG_STANDARD = (210, 180, 230, 260)
+HEAVY_LEFT_LEG_WIDE = (160, 180, 190, 260)
+HEAVY_RIGHT_LEG_WIDE = (210, 180, 240, 260)
+HEAVY_LEFT_FOOT = (170, 255, 180, 265)
+HEAVY_RIGHT_FOOT = (220, 255, 230, 265)
+
+ANTENNA_ROD = (200, 40, 200, 15)
+ANTENNA_BULB = (195, 10, 205, 20)
+ANTENNA_BULB_CORE = (197, 12, 203, 18)
+NAME_POS = (200, 20)
+
+
+def _create_humanoid_items(canvas):
+    # Создаем все примитивы гуманоида один раз (скрытыми); варианты
+    # стилей существуют параллельно и переключаются через state
+    create_oval = canvas.create_oval
+    create_line = canvas.create_line
+    create_rectangle = canvas.create_rectangle
+    create_arc = canvas.create_arc
+    create_text = canvas.create_text
+    items = {}
+    # Голова: оба варианта ("oval" и "square")
+    items["head_square"] = create_rectangle(*HUM_HEAD, fill="peachpuff", outline="black", width=2, state='hidden')
+    items["head_square_shade"] = create_line(*HUM_HEAD_SHADE, fill="gray", width=2, dash=(2, 2), state='hidden')
+    items["head_oval"] = create_oval(*HUM_HEAD, fill="peachpuff", outline="black", width=2, state='hidden')
+    items["head_oval_shine"] = create_arc(*HUM_HEAD_SHINE, start=30, extent=120, style=tk.ARC, outline="white", width=1, state='hidden')
+    # Глаза – белки и радужка
+    items["left_eye_white"] = create_oval(*HUM_LEFT_EYE, fill="white", outline="black", state='hidden')
+    items["left_iris"] = create_oval(*HUM_LEFT_IRIS, fill="black", outline="black", state='hidden')
+    items["right_eye_white"] = create_oval(*HUM_RIGHT_EYE, fill="white", outline="black", state='hidden')
+    items["right_iris"] = create_oval(*HUM_RIGHT_IRIS, fill="black", outline="black", state='hidden')
+    # Рот – легкая улыбка
+    items["mouth"] = create_arc(*HUM_MOUTH, start=200, extent=140, style=tk.CHORD, fill="red", state='hidden')
+    # Торс: один прямоугольник, "мышцы" отдельными линиями
+    items["torso"] = create_rectangle(*HUM_TORSO_STANDARD, fill="skyblue", outline="black", width=2, state='hidden')
+    items["torso_muscle_h"] = create_line(*HUM_TORSO_MUSCLE_H, fill="blue", width=2, state='hidden')
+    items["torso_muscle_v"] = create_line(*HUM_TORSO_MUSCLE_V, fill="blue", width=2, state='hidden')
+    # Руки: координаты общие, стиль меняет толщину и цвет суставов
+    items["left_arm"] = create_line(*HUM_LEFT_ARM, fill="black", width=3, state='hidden')
+    items["right_arm"] = create_line(*HUM_RIGHT_ARM, fill="black", width=3, state='hidden')
+    items["left_arm_joint"] = create_oval(*HUM_LEFT_ARM_JOINT, fill="black", outline="black", state='hidden')
+    items["right_arm_joint"] = create_oval(*HUM_RIGHT_ARM_JOINT, fill="black", outline="black", state='hidden')
+    # Ноги: линии для "standard", прямоугольники для "wide"
+    items["left_leg_line"] = create_line(*HUM_LEFT_LEG_LINE, fill="black", width=3, state='hidden')
+    items["right_leg_line"] = create_line(*HUM_RIGHT_LEG_LINE, fill="black", width=3, state='hidden')
+    items["left_leg_wide"] = create_rectangle(*HUM_LEFT_LEG_WIDE, fill="black", state='hidden')
+    items["right_leg_wide"] = create_rectangle(*HUM_RIGHT_LEG_WIDE, fill="black", state='hidden')
+    items["left_foot"] = create_oval(*HUM_LEFT_FOOT_STANDARD, fill="black", outline="black", state='hidden')
+    items["right_foot"] = create_oval(*HUM_RIGHT_FOOT_STANDARD, fill="black", outline="black", state='hidden')
+    # Антенна
+    items["antenna_rod"] = create_line(*ANTENNA_ROD, fill="green", width=2, state='hidden')
+    items["antenna_bulb"] = create_oval(*ANTENNA_BULB, fill="green", outline="black", state='hidden')
+    items["antenna_bulb_core"] = create_oval(*ANTENNA_BULB_CORE, fill="lightgreen", outline="green", state='hidden')
+    items["name_text"] = create_text(*NAME_POS, text="", font=("Helvetica", 16, "bold"), fill="darkblue", state='hidden')
+    return items
+
+
+def _draw_humanoid_oval_head(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["head_oval"], state='normal')
+    itemconfig(items["head_oval_shine"], state='normal')
+    itemconfig(items["head_square"], state='hidden')
+    itemconfig(items["head_square_shade"], state='hidden')
+
+
+def _draw_humanoid_square_head(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["head_oval"], state='hidden')
+    itemconfig(items["head_oval_shine"], state='hidden')
+    itemconfig(items["head_square"], state='normal')
+    itemconfig(items["head_square_shade"], state='normal')
+
+
+def _draw_humanoid_standard_torso(canvas, items, robot):
+    canvas.coords(items["torso"], *HUM_TORSO_STANDARD)
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["torso"], fill="skyblue", width=2, state='normal')
+    itemconfig(items["torso_muscle_h"], state='hidden')
+    itemconfig(items["torso_muscle_v"], state='hidden')
+
+
+def _draw_humanoid_muscular_torso(canvas, items, robot):
+    canvas.coords(items["torso"], *HUM_TORSO_MUSCULAR)
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["torso"], fill="lightblue", width=4, state='normal')
+    itemconfig(items["torso_muscle_h"], state='normal')
+    itemconfig(items["torso_muscle_v"], state='normal')
+
+
+def _draw_humanoid_standard_arms(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["left_arm"], width=3, state='normal')
+    itemconfig(items["right_arm"], width=3, state='normal')
+    itemconfig(items["left_arm_joint"], fill="black", outline="black", state='normal')
+    itemconfig(items["right_arm_joint"], fill="black", outline="black", state='normal')
+
+
+def _draw_humanoid_hydraulic_arms(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["left_arm"], width=5, state='normal')
+    itemconfig(items["right_arm"], width=5, state='normal')
+    itemconfig(items["left_arm_joint"], fill="gray", outline="black", state='normal')
+    itemconfig(items["right_arm_joint"], fill="gray", outline="black", state='normal')
+
+
+def _draw_humanoid_standard_legs(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["left_leg_line"], state='normal')
+    itemconfig(items["right_leg_line"], state='normal')
+    itemconfig(items["left_leg_wide"], state='hidden')
+    itemconfig(items["right_leg_wide"], state='hidden')
+    canvas.coords(items["left_foot"], *HUM_LEFT_FOOT_STANDARD)
+    canvas.coords(items["right_foot"], *HUM_RIGHT_FOOT_STANDARD)
+    itemconfig(items["left_foot"], fill="black", outline="black", state='normal')
+    itemconfig(items["right_foot"], fill="black", outline="black", state='normal')
+
+
+def _draw_humanoid_wide_legs(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["left_leg_line"], state='hidden')
+    itemconfig(items["right_leg_line"], state='hidden')
+    itemconfig(items["left_leg_wide"], state='normal')
+    itemconfig(items["right_leg_wide"], state='normal')
+    canvas.coords(items["left_foot"], *HUM_LEFT_FOOT_WIDE)
+    canvas.coords(items["right_foot"], *HUM_RIGHT_FOOT_WIDE)
+    itemconfig(items["left_foot"], fill="gray", outline="black", state='normal')
+    itemconfig(items["right_foot"], fill="gray", outline="black", state='normal')
+
+
+def _draw_antenna_hidden(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["antenna_rod"], state='hidden')
+    itemconfig(items["antenna_bulb"], state='hidden')
+    itemconfig(items["antenna_bulb_core"], state='hidden')
+
+
+def _draw_antenna_shown(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["antenna_rod"], state='normal')
+    itemconfig(items["antenna_bulb"], state='normal')
+    itemconfig(items["antenna_bulb_core"], state='normal')
+
+
+def _show_humanoid_base(canvas, items, robot):
+    # Всегда видимые детали: глаза (с цветом радужки), рот и имя
+    itemconfig = canvas.itemconfigure
+    eye_color = robot.components.get("eye_color", "black")
+    itemconfig(items["left_eye_white"], state='normal')
+    itemconfig(items["right_eye_white"], state='normal')
+    itemconfig(items["left_iris"], fill=eye_color, outline=eye_color, state='normal')
+    itemconfig(items["right_iris"], fill=eye_color, outline=eye_color, state='normal')
+    itemconfig(items["mouth"], state='normal')
+    itemconfig(items["name_text"], text=robot.name, state='normal')
+
+
+def _create_heavy_items(canvas):
+    create_oval = canvas.create_oval
+    create_line = canvas.create_line
+    create_rectangle = canvas.create_rectangle
+    create_arc = canvas.create_arc
+    create_text = canvas.create_text
+    items = {}
+    # Голова: оба варианта ("rectangle" и "dome")
+    items["head_dome"] = create_arc(*HEAVY_HEAD, start=0, extent=180, fill="dimgray", outline="black", width=3, state='hidden')
+    items["head_dome_line"] = create_line(*HEAVY_HEAD_DOME_LINE, fill="black", width=2, state='hidden')
+    items["head_rect"] = create_rectangle(*HEAVY_HEAD, fill="dimgray", outline="black", width=3, state='hidden')
+    for i, x in enumerate(range(160, 240, 20)):
+        items[f"rivet_{i}"] = create_oval(x, 45, x + 10, 55, fill="black", state='hidden')
+    # Торс: один прямоугольник, панели отдельными линиями
+    items["torso"] = create_rectangle(*HEAVY_TORSO, fill="gray", outline="black", width=3, state='hidden')
+    items["torso_panel_h"] = create_line(*HEAVY_TORSO_PANEL_H, fill="black", width=2, state='hidden')
+    items["torso_panel_v"] = create_line(*HEAVY_TORSO_PANEL_V, fill="black", width=2, state='hidden')
+    # Руки: короба общие, механические детали только для "robotic"
+    items["left_arm_box"] = create_rectangle(*HEAVY_LEFT_ARM_BOX, fill="dimgray", outline="black", width=3, state='hidden')
+    items["right_arm_box"] = create_rectangle(*HEAVY_RIGHT_ARM_BOX, fill="dimgray", outline="black", width=3, state='hidden')
+    items["left_arm_rod"] = create_line(*HEAVY_LEFT_ARM_ROD, fill="black", width=2, state='hidden')
+    items["right_arm_rod"] = create_line(*HEAVY_RIGHT_ARM_ROD, fill="black", width=2, state='hidden')
+    items["left_arm_joint"] = create_oval(*HEAVY_LEFT_ARM_JOINT, fill="black", outline="gray", state='hidden')
+    items["right_arm_joint"] = create_oval(*HEAVY_RIGHT_ARM_JOINT, fill="black", outline="gray", state='hidden')
+    # Ноги: прямоугольники в обоих стилях, суставы только для "wide"
+    items["left_leg"] = create_rectangle(*HEAVY_LEFT_LEG_STANDARD, fill="black", outline="black", state='hidden')
+    items["right_leg"] = create_rectangle(*HEAVY_RIGHT_LEG_STANDARD, fill="black", outline="black", state='hidden')
+    items["left_foot"] = create_oval(*HEAVY_LEFT_FOOT, fill="gray", outline="black", state='hidden')
+    items["right_foot"] = create_oval(*HEAVY_RIGHT_FOOT, fill="gray", outline="black", state='hidden')
+    # Антенна
+    items["antenna_rod"] = create_line(*ANTENNA_ROD, fill="green", width=2, state='hidden')
+    items["antenna_bulb"] = create_oval(*ANTENNA_BULB, fill="green", outline="black", state='hidden')
+    items["antenna_bulb_core"] = create_oval(*ANTENNA_BULB_CORE, fill="lightgreen", outline="green", state='hidden')
+    items["name_text"] = create_text(*NAME_POS, text="", font=("Helvetica", 16, "bold"), fill="darkred", state='hidden')
+    return items
+
+
+def _draw_heavy_rect_head(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["head_rect"], state='normal')
+    itemconfig(items["head_dome"], state='hidden')
+    itemconfig(items["head_dome_line"], state='hidden')
+
+
+def _draw_heavy_dome_head(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["head_rect"], state='hidden')
+    itemconfig(items["head_dome"], state='normal')
+    itemconfig(items["head_dome_line"], state='normal')
+
+
+def _draw_heavy_standard_torso(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["torso"], width=3, state='normal')
+    itemconfig(items["torso_panel_h"], state='hidden')
+    itemconfig(items["torso_panel_v"], state='hidden')
+
+
+def _draw_heavy_armored_torso(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["torso"], width=4, state='normal')
+    itemconfig(items["torso_panel_h"], state='normal')
+    itemconfig(items["torso_panel_v"], state='normal')
+
+
+def _draw_heavy_standard_arms(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["left_arm_box"], state='normal')
+    itemconfig(items["right_arm_box"], state='normal')
+    itemconfig(items["left_arm_rod"], state='hidden')
+    itemconfig(items["right_arm_rod"], state='hidden')
+    itemconfig(items["left_arm_joint"], state='hidden')
+    itemconfig(items["right_arm_joint"], state='hidden')
+
+
+def _draw_heavy_robotic_arms(canvas, items, robot):
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["left_arm_box"], state='normal')
+    itemconfig(items["right_arm_box"], state='normal')
+    itemconfig(items["left_arm_rod"], state='normal')
+    itemconfig(items["right_arm_rod"], state='normal')
+    itemconfig(items["left_arm_joint"], state='normal')
+    itemconfig(items["right_arm_joint"], state='normal')
+
+
+def _draw_heavy_standard_legs(canvas, items, robot):
+    canvas.coords(items["left_leg"], *HEAVY_LEFT_LEG_STANDARD)
+    canvas.coords(items["right_leg"], *HEAVY_RIGHT_LEG_STANDARD)
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["left_leg"], state='normal')
+    itemconfig(items["right_leg"], state='normal')
+    itemconfig(items["left_foot"], state='hidden')
+    itemconfig(items["right_foot"], state='hidden')
+
+
+def _draw_heavy_wide_legs(canvas, items, robot):
+    canvas.coords(items["left_leg"], *HEAVY_LEFT_LEG_WIDE)
+    canvas.coords(items["right_leg"], *HEAVY_RIGHT_LEG_WIDE)
+    itemconfig = canvas.itemconfigure
+    itemconfig(items["left_leg"], state='normal')
+    itemconfig(items["right_leg"], state='normal')
+    itemconfig(items["left_foot"], state='normal')
+    itemconfig(items["right_foot"], state='normal')
+
+
+def _show_heavy_base(canvas, items, robot):
+    # Всегда видимые детали: заклепки на голове и имя
+    itemconfig = canvas.itemconfigure
+    for i in range(4):
+        itemconfig(items[f"rivet_{i}"], state='normal')
+    itemconfig(items["name_text"], text=robot.name, state='normal')
+
+
+# Таблицы (деталь, код стиля) -> отрисовщик; в components стили хранятся
+# как IntEnum-коды, поэтому на пути отрисовки нет ни .lower(), ни хеша строк
+HUMANOID_DRAWERS = {
+    "head_style": {HeadStyle.OVAL: _draw_humanoid_oval_head, HeadStyle.SQUARE: _draw_humanoid_square_head},
+    "torso_style": {TorsoStyle.STANDARD: _draw_humanoid_standard_torso, TorsoStyle.MUSCULAR: _draw_humanoid_muscular_torso},
+    "arm_style": {ArmStyle.STANDARD: _draw_humanoid_standard_arms, ArmStyle.HYDRAULIC: _draw_humanoid_hydraulic_arms},
+    "legs": {LegStyle.STANDARD: _draw_humanoid_standard_legs, LegStyle.WIDE: _draw_humanoid_wide_legs},
+    "antenna": {AntennaStyle.NONE: _draw_antenna_hidden, AntennaStyle.SMALL: _draw_antenna_shown, AntennaStyle.LARGE: _draw_antenna_shown},
+}
+
+HUMANOID_STYLE_DEFAULTS = {
+    "head_style": HeadStyle.OVAL,
+    "torso_style": TorsoStyle.STANDARD,
+    "arm_style": ArmStyle.STANDARD,
+    "legs": LegStyle.STANDARD,
+    "antenna": AntennaStyle.NONE,
+}
+
+HEAVY_DRAWERS = {
+    "head_style": {HeadStyle.RECTANGLE: _draw_heavy_rect_head, HeadStyle.DOME: _draw_heavy_dome_head},
+    "torso_style": {TorsoStyle.STANDARD: _draw_heavy_standard_torso, TorsoStyle.ARMORED: _draw_heavy_armored_torso},
+    "arm_style": {ArmStyle.STANDARD: _draw_heavy_standard_arms, ArmStyle.ROBOTIC: _draw_heavy_robotic_arms},
+    "legs": {LegStyle.STANDARD: _draw_heavy_standard_legs, LegStyle.WIDE: _draw_heavy_wide_legs},
+    "antenna": {AntennaStyle.NONE: _draw_antenna_hidden, AntennaStyle.SMALL: _draw_antenna_shown, AntennaStyle.LARGE: _draw_antenna_shown},
+}
+
+HEAVY_STYLE_DEFAULTS = {
+    "head_style": HeadStyle.RECTANGLE,
+    "torso_style": TorsoStyle.STANDARD,
+    "arm_style": ArmStyle.STANDARD,
+    "legs": LegStyle.STANDARD,
+    "antenna": AntennaStyle.NONE,
+}
+
+# Диспетчеризация по точному типу робота: один поиск в словаре вместо isinstance
+DRAWERS_BY_TYPE = {
+    HumanoidRobot: (HUMANOID_DRAWERS, HUMANOID_STYLE_DEFAULTS, _show_humanoid_base),
+    HeavyRobot: (HEAVY_DRAWERS, HEAVY_STYLE_DEFAULTS, _show_heavy_base),
+}
+
+# Наборы вариантов для диалога редактирования, тоже по точному типу
+EDIT_OPTIONS_BY_TYPE = {
+    HumanoidRobot: {
+        "head": ["Oval", "Square"],
+        "torso": ["Standard", "Muscular"],
+        "arm": ["Standard", "Hydraulic"],
+        "has_eye_color": True,
+    },
+    HeavyRobot: {
+        "head": ["Rectangle", "Dome"],
+        "torso": ["Standard", "Armored"],
+        "arm": ["Standard", "Robotic"],
+        "has_eye_color": False,
+    },
+}
+
+
+# ---------------- GUI: Приложение для создания и визуализации роботов ----------------
+class RobotFactoryApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Robot Factory Application")
+
+        # Левая панель: управление и лог
+        self.left_panel = tk.Frame(root)
+        self.left_panel.grid(row=0, column=0, padx=10, pady=10, sticky="ns")
+        # Правая панель: визуализация роботов
+        self.right_panel = tk.Frame(root)
+        self.right_panel.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        root.grid_columnconfigure(1, weight=1)
+        root.grid_rowconfigure(0, weight=1)
+
+        # Элементы управления на левой панели
+        self.name_label = tk.Label(self.left_panel, text="Enter Robot Name:")
+        self.name_label.pack(pady=5)
+        self.name_entry = tk.Entry(self.left_panel, width=25)
+        self.name_entry.pack(pady=5)
+        self.btn_humanoid = tk.Button(self.left_panel, text="Create Humanoid Robot", command=self.create_humanoid_robot)
+        self.btn_humanoid.pack(pady=5)
+        self.btn_heavy = tk.Button(self.left_panel, text="Create Heavy Robot", command=self.create_heavy_robot)
+        self.btn_heavy.pack(pady=5)
+        self.btn_clone = tk.Button(self.left_panel, text="Clone Last Robot", command=self.clone_robot)
+        self.btn_clone.pack(pady=5)
+        self.robot_list_label = tk.Label(self.left_panel, text="Robots:")
+        self.robot_list_label.pack(pady=5)
+        self.robot_listbox = tk.Listbox(self.left_panel, width=40, height=8)
+        self.robot_listbox.pack(pady=5)
+        self.log_label = tk.Label(self.left_panel, text="Log:")
+        self.log_label.pack(pady=5)
+        self.debug_var = tk.BooleanVar(value=False)
+        self.debug_check = tk.Checkbutton(self.left_panel, text="Debug log",
+                                          variable=self.debug_var, command=self.toggle_debug)
+        self.debug_check.pack(pady=5)
+        self.log_text = scrolledtext.ScrolledText(self.left_panel, width=40, height=10, state=tk.DISABLED)
+        self.log_text.pack(pady=5)
+
+        # Область визуализации робота на правой панели
+        self.canvas = tk.Canvas(self.right_panel, width=400, height=400, bg="lightgray")
+        self.canvas.pack(fill="both", expand=True)
+
+        # Буфер сообщений лога: копим и выталкиваем в виджет одной
+        # вставкой за тик событийного цикла
+        self._log_buffer = []
+        self._log_flush_scheduled = False
+
+        # Инициализация логгера с передачей функции обновления лога
+        self.logger = SingletonLogger(self.update_log)
+        self.logger.log("Application started")
+
+        # Фабрики роботов
+        self.humanoid_factory = HumanoidRobotFactory()
+        self.heavy_factory = HeavyRobotFactory()
+
+        self.robots = []
+        self.last_robot = None
+        # Строка списка каждого робота: id(robot) -> индекс в Listbox
+        self._robot_rows = {}
+
+        # Оба скелета роботов создаются один раз при старте (скрытыми):
+        # дальше любая отрисовка - только itemconfig/coords по готовым
+        # примитивам, без выделения новых элементов Tcl
+        self._item_cache = {
+            HumanoidRobot: _create_humanoid_items(self.canvas),
+            HeavyRobot: _create_heavy_items(self.canvas),
+        }
+        self._shown_type = None
+        self._shown_robot = None
+
+    def toggle_debug(self):
+        self.logger.level = LOG_DEBUG if self.debug_var.get() else LOG_INFO
+
+    def update_log(self, message):
+        self._log_buffer.append(message)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        self._log_flush_scheduled = False
+        if not self._log_buffer:
+            return
+        text = "".join(self._log_buffer)
+        self._log_buffer.clear()
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.insert(tk.END, text)
+        self.log_text.see(tk.END)
+        self.log_text.config(state=tk.DISABLED)
+
+    def _append_robot_row(self, robot):
+        # Новый робот – одна вставка в конец вместо перезаливки всего списка
+        self._robot_rows[id(robot)] = self.robot_listbox.size()
+        self.robot_listbox.insert(tk.END, str(robot))
+
+    def _refresh_robot_row(self, robot):
+        # Изменившийся робот – точечная замена его строки
+        idx = self._robot_rows[id(robot)]
+        self.robot_listbox.delete(idx)
+        self.robot_listbox.insert(idx, str(robot))
+
+    def draw_robot(self, robot):
+        canvas = self.canvas
+        # Приостанавливаем перерисовку: все itemconfig/coords применятся пачкой
+        canvas.configure(state='disabled')
+        rtype = type(robot)
+        # Скелеты обоих типов уже созданы; при смене типа прячем чужой
+        # скелет вместо delete("all") и пересоздания примитивов
+        if self._shown_type is not None and self._shown_type is not rtype:
+            itemconfig = canvas.itemconfigure
+            for item in self._item_cache[self._shown_type].values():
+                itemconfig(item, state='hidden')
+        entry = DRAWERS_BY_TYPE.get(rtype)
+        if entry is None:
+            items = self._item_cache.get(rtype)
+            if items is None:
+                items = {"name_text": canvas.create_text(200, 200, text="Unknown Robot Type", font=("Helvetica", 16), state='hidden')}
+                self._item_cache[rtype] = items
+            canvas.itemconfigure(items["name_text"], state='normal')
+        else:
+            items = self._item_cache[rtype]
+            drawers, defaults, show_base = entry
+            # Отрисовка проходит по таблице отрисовщиков; стиль каждой
+            # детали читается из components ровно один раз через локально
+            # связанные comps_get/defaults_get (LOAD_FAST вместо
+            # повторных поисков атрибутов)
+            comps_get = robot.components.get
+            defaults_get = defaults.get
+            for comp, style_drawers in drawers.items():
+                style_drawers[comps_get(comp, defaults_get(comp))](canvas, items, robot)
+            show_base(canvas, items, robot)
+        self._shown_type = rtype
+        self._shown_robot = id(robot)
+        canvas.configure(state='normal')
+        canvas.update_idletasks()
+
+    def create_humanoid_robot(self):
+        name = self.name_entry.get().strip() or f"Humanoid-{len(self.robots) + 1}"
+        robot = self.humanoid_factory.create_robot(name)
+        self.last_robot = robot
+        self.robots.append(robot)
+        self.logger.log(f"Created humanoid robot: {robot}")
+        self._append_robot_row(robot)
+        self.draw_robot(robot)
+
+    def create_heavy_robot(self):
+        name = self.name_entry.get().strip() or f"Heavy-{len(self.robots) + 1}"
+        robot = self.heavy_factory.create_robot(name)
+        self.last_robot = robot
+        self.robots.append(robot)
+        self.logger.log(f"Created heavy robot: {robot}")
+        self._append_robot_row(robot)
+        self.draw_robot(robot)
+
+    def clone_robot(self):
+        if self.last_robot:
+            new_robot = self.last_robot.clone()
+            new_robot.name = f"{new_robot.name}_clone"
+            self.robots.append(new_robot)
+            self.last_robot = new_robot
+            self.logger.log(f"Cloned robot: {new_robot}")
+            self._append_robot_row(new_robot)
+            # Не рисуем клон сразу: Apply в диалоге все равно вызовет
+            # draw_robot, а при закрытии без Apply сработает <Destroy>
+            self.open_edit_dialog(new_robot)
+        else:
+            self.logger.log("No robot to clone.")
+
+    def open_edit_dialog(self, robot):
+        edit_window = tk.Toplevel(self.root)
+        edit_window.title("Edit Cloned Robot")
+        options = EDIT_OPTIONS_BY_TYPE[type(robot)]
+
+        # Имя робота
+        tk.Label(edit_window, text="New Robot Name:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        name_var = tk.StringVar(value=robot.name)
+        tk.Entry(edit_window, textvariable=name_var).grid(row=0, column=1, padx=5, pady=5)
+
+        # Антенна
+        tk.Label(edit_window, text="Antenna:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
+        antenna_options = ["None", "Small", "Large"]
+        antenna_var = tk.StringVar(value=robot.components.get("antenna", AntennaStyle.NONE).name.title())
+        tk.OptionMenu(edit_window, antenna_var, *antenna_options).grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+
+        # Legs style
+        tk.Label(edit_window, text="Legs style:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
+        legs_options = ["Standard", "Wide"]
+        legs_var = tk.StringVar(value=robot.components.get("legs", LegStyle.STANDARD).name.title())
+        tk.OptionMenu(edit_window, legs_var, *legs_options).grid(row=2, column=1, padx=5, pady=5, sticky="ew")
+
+        # Head style
+        tk.Label(edit_window, text="Head Style:").grid(row=3, column=0, padx=5, pady=5, sticky="w")
+        head_options = options["head"]
+        head_var = tk.StringVar(value=robot.components.get("head_style", HeadStyle[head_options[0].upper()]).name.title())
+        tk.OptionMenu(edit_window, head_var, *head_options).grid(row=3, column=1, padx=5, pady=5, sticky="ew")
+
+        # Torso style
+        tk.Label(edit_window, text="Torso Style:").grid(row=4, column=0, padx=5, pady=5, sticky="w")
+        torso_options = options["torso"]
+        torso_var = tk.StringVar(value=robot.components.get("torso_style", TorsoStyle.STANDARD).name.title())
+        tk.OptionMenu(edit_window, torso_var, *torso_options).grid(row=4, column=1, padx=5, pady=5, sticky="ew")
+
+        # Arm style
+        tk.Label(edit_window, text="Arm Style:").grid(row=5, column=0, padx=5, pady=5, sticky="w")
+        arm_options = options["arm"]
+        arm_var = tk.StringVar(value=robot.components.get("arm_style", ArmStyle.STANDARD).name.title())
+        tk.OptionMenu(edit_window, arm_var, *arm_options).grid(row=5, column=1, padx=5, pady=5, sticky="ew")
+
+        # Eye color (только для Humanoid)
+        if options["has_eye_color"]:
+            tk.Label(edit_window, text="Eye Color:").grid(row=6, column=0, padx=5, pady=5, sticky="w")
+            eye_options = ["Black", "Blue", "Green", "Brown", "Hazel"]
+            eye_var = tk.StringVar(value=robot.components.get("eye_color", "black").title())
+            tk.OptionMenu(edit_window, eye_var, *eye_options).grid(row=6, column=1, padx=5, pady=5, sticky="ew")
+            row_offset = 1
+        else:
+            row_offset = 0
+
+        # Живой предпросмотр: каждая переменная диалога тянет точечный
+        # отрисовщик своей детали через таблицу, без полной перерисовки
+        drawers = DRAWERS_BY_TYPE[type(robot)][0]
+
+        def preview_items():
+            # Перед точечным itemconfig скелет должен показывать именно
+            # этого робота (клон до Apply еще ни разу не рисовался)
+            if self._shown_robot != id(robot):
+                self.draw_robot(robot)
+            return self._item_cache[type(robot)]
+
+        def make_style_preview(comp, var, enum_cls):
+            def preview(*args):
+                items = preview_items()
+                drawers[comp][enum_cls[var.get().upper()]](self.canvas, items, robot)
+            return preview
+
+        antenna_var.trace_add("write", make_style_preview("antenna", antenna_var, AntennaStyle))
+        legs_var.trace_add("write", make_style_preview("legs", legs_var, LegStyle))
+        head_var.trace_add("write", make_style_preview("head_style", head_var, HeadStyle))
+        torso_var.trace_add("write", make_style_preview("torso_style", torso_var, TorsoStyle))
+        arm_var.trace_add("write", make_style_preview("arm_style", arm_var, ArmStyle))
+
+        def preview_name(*args):
+            items = preview_items()
+            self.canvas.itemconfigure(items["name_text"], text=name_var.get().strip() or robot.name)
+
+        name_var.trace_add("write", preview_name)
+
+        if options["has_eye_color"]:
+            def preview_eye_color(*args):
+                items = preview_items()
+                color = eye_var.get().lower()
+                itemconfig = self.canvas.itemconfigure
+                itemconfig(items["left_iris"], fill=color, outline=color)
+                itemconfig(items["right_iris"], fill=color, outline=color)
+
+            eye_var.trace_add("write", preview_eye_color)
+
+        applied = False
+
+        def apply_changes():
+            nonlocal applied
+            applied = True
+            new_name = name_var.get().strip()
+            if new_name:
+                robot.name = new_name
+            # Стили храним как IntEnum-коды: преобразование из подписи
+            # OptionMenu происходит один раз здесь, путь отрисовки
+            # сравнивает и хеширует только целые числа
+            robot.components["antenna"] = AntennaStyle[antenna_var.get().upper()]
+            robot.components["legs"] = LegStyle[legs_var.get().upper()]
+            robot.components["head_style"] = HeadStyle[head_var.get().upper()]
+            robot.components["torso_style"] = TorsoStyle[torso_var.get().upper()]
+            robot.components["arm_style"] = ArmStyle[arm_var.get().upper()]
+            if options["has_eye_color"]:
+                robot.components["eye_color"] = eye_var.get().lower()
+            robot._str_cache = None
+            self.logger.log(f"Modified cloned robot: {robot}")
+            self._refresh_robot_row(robot)
+            self.draw_robot(robot)
+            edit_window.destroy()
+
+        def on_destroy(event):
+            # Диалог закрыт без Apply – выполняем единственную отрисовку
+            # клона; при закрытии всего приложения холст уничтожается
+            # раньше Toplevel, поэтому проверяем, что он еще жив
+            if event.widget is edit_window and not applied and self.canvas.winfo_exists():
+                self.draw_robot(robot)
+
+        edit_window.bind("<Destroy>", on_destroy)
+
+        tk.Button(edit_window, text="Apply Changes", command=apply_changes).grid(row=7 + row_offset, column=0,
+                                                                                 columnspan=2, pady=10)
+
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = RobotFactoryApp(root)
+    root.mainloop()